@@ -29,6 +29,8 @@ from scipy.misc import comb
 
 import scipy.constants as constants
 
+from monty.functools import lazy_property
+
 
 class EwaldSummation(object):
     """
@@ -114,16 +116,26 @@ class EwaldSummation(object):
         if self._compute_forces:
             self._forces = recip_forces + real_point_forces
 
+    @lazy_property
+    def _total_energy_matrix(self):
+        # Built on first use only, then reused: compute_partial_energy is
+        # called once per candidate ordering.
+        totalenergy = self._recip + self._real
+        for i in range(len(self._point)):
+            totalenergy[i, i] += self._point[i]
+        return totalenergy
+
     def compute_partial_energy(self, removed_indices):
         """
         Gives total ewald energy for certain sites being removed, i.e. zeroed
         out.
         """
-        total_energy_matrix = self.total_energy_matrix.copy()
-        for i in removed_indices:
-            total_energy_matrix[i, :] = 0
-            total_energy_matrix[:, i] = 0
-        return sum(sum(total_energy_matrix))
+        total_energy_matrix = self._total_energy_matrix
+        # Sum the block of the remaining sites instead of zeroing the rows
+        # and columns of a copy and summing row by row in python.
+        keep = np.ones(len(total_energy_matrix), dtype=np.bool_)
+        keep[list(removed_indices)] = False
+        return np.sum(total_energy_matrix[np.ix_(keep, keep)])
 
     def compute_sub_structure(self, sub_structure, tol=1e-3):
         """
@@ -138,7 +150,7 @@ class EwaldSummation(object):
         Returns:
             Ewald sum of substructure.
         """
-        total_energy_matrix = self.total_energy_matrix.copy()
+        total_energy_matrix = self._total_energy_matrix.copy()
 
         def find_match(site):
             for test_site in sub_structure:
@@ -235,10 +247,8 @@ class EwaldSummation(object):
         The total energy matrix. Each matrix element (i, j) corresponds to the
         total interaction energy between site i and site j.
         """
-        totalenergy = self._recip + self._real
-        for i in range(len(self._point)):
-            totalenergy[i, i] += self._point[i]
-        return totalenergy
+        # Callers are free to modify the returned matrix.
+        return self._total_energy_matrix.copy()
 
     @property
     def forces(self):
@@ -420,13 +430,10 @@ class EwaldMinimizer:
 
     def __init__(self, matrix, m_list, num_to_return=1, algo=ALGO_FAST):
         # Setup and checking of inputs
-        self._matrix = copy(matrix)
+        matrix = np.asarray(matrix)
         # Make the matrix diagonally symmetric (so matrix[i,:] == matrix[:,j])
-        for i in range(len(self._matrix)):
-            for j in range(i, len(self._matrix)):
-                value = (self._matrix[i, j] + self._matrix[j, i]) / 2
-                self._matrix[i, j] = value
-                self._matrix[j, i] = value
+        # This creates a new array so the input matrix is left untouched.
+        self._matrix = (matrix + matrix.T) / 2
 
         # sort the m_list based on number of permutations
         self._m_list = sorted(m_list, key=lambda x: comb(len(x[2]), x[1]),
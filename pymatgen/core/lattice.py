@@ -778,11 +778,13 @@ class Lattice(MSONable):
         Returns:
             New lattice with desired volume.
         """
-        versors = self.matrix / self.abc
+        # Use the internal arrays: self.matrix and self.abc return copies.
+        lengths = self._lengths
+        versors = self._matrix / lengths
 
         geo_factor = abs(np.dot(np.cross(versors[0], versors[1]), versors[2]))
 
-        ratios = self.abc / self.c
+        ratios = lengths / lengths[2]
 
         new_c = (new_volume / ( geo_factor * np.prod(ratios))) ** (1/3.)
 
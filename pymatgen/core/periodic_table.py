@@ -15,6 +15,7 @@ from pymatgen.core.units import Mass, Length, unitized, FloatWithUnit, Unit, \
 from pymatgen.util.string_utils import formula_double_format
 from monty.json import MSONable
 from monty.dev import deprecated
+from monty.functools import lru_cache
 
 """
 Module contains classes presenting Element and Specie (Element + oxidation
@@ -1291,6 +1292,9 @@ def get_el_sp(obj):
     which Element parsing will be attempted (e.g., Mn), failing which
     DummyElement parsing will be attempted.
 
+    The results of the parsing are cached since the same strings are parsed
+    over and over (e.g. by Composition and the transformations).
+
     Args:
         obj (Element/Specie/str/int): An arbitrary object.  Supported objects
             are actual Element/Specie objects, integers (representing atomic
@@ -1306,6 +1310,14 @@ def get_el_sp(obj):
     if isinstance(obj, (Element, Specie, DummySpecie)):
         return obj
 
+    return _get_el_sp_from_value(obj)
+
+
+@lru_cache()
+def _get_el_sp_from_value(obj):
+    """
+    Parse an int or a string into an Element or Specie. See get_el_sp.
+    """
     try:
         c = float(obj)
         i = int(c)
@@ -1095,6 +1095,12 @@ class IStructure(SiteCollection, MSONable):
         grouped_fcoords = [np.array([s.frac_coords for s in g])
                            for g in grouped_sites]
 
+        # the cell can only be a supercell of num_fu primitive cells. If the
+        # species counts have no common factor, it is already primitive
+        num_fu = six.moves.reduce(gcd, map(len, grouped_sites))
+        if num_fu == 1:
+            return self.copy()
+
         # min_vecs are approximate periodicities of the cell. The exact
         # periodicities from the supercell matrices are checked against these
         # first
@@ -1161,7 +1167,8 @@ class IStructure(SiteCollection, MSONable):
             np.fill_diagonal(non_nbrs, True)
             grouped_non_nbrs.append(non_nbrs)
 
-        num_fu = six.moves.reduce(gcd, map(len, grouped_sites))
+        # lattice.matrix returns a copy, so get it once
+        latt_matrix = self.lattice.matrix
         for size, ms in get_hnf(num_fu):
             inv_ms = np.linalg.inv(ms)
 
@@ -1174,7 +1181,7 @@ class IStructure(SiteCollection, MSONable):
             inds = np.all(any_close, axis=-1)
 
             for inv_m, m in zip(inv_ms[inds], ms[inds]):
-                new_m = np.dot(inv_m, self.lattice.matrix)
+                new_m = np.dot(inv_m, latt_matrix)
                 ftol = np.divide(tolerance, np.sqrt(np.sum(new_m ** 2, axis=1)))
 
                 valid = True
@@ -1220,8 +1227,7 @@ class IStructure(SiteCollection, MSONable):
                             new_coords.append(coords)
 
                 if valid:
-                    inv_m = np.linalg.inv(m)
-                    new_l = Lattice(np.dot(inv_m, self.lattice.matrix))
+                    new_l = Lattice(new_m)
                     s = Structure(new_l, new_sp, new_coords,
                                   coords_are_cartesian=False)
 
@@ -2372,6 +2378,7 @@ class Structure(IStructure, collections.MutableSequence):
         Args:
             indices: Sequence of indices of sites to delete.
         """
+        indices = set(indices)
         self._sites = [s for i, s in enumerate(self._sites)
                        if i not in indices]
 
@@ -2418,10 +2425,12 @@ class Structure(IStructure, collections.MutableSequence):
             new_lattice (Lattice): New lattice
         """
         self._lattice = new_lattice
+        # The species (immutable Composition) and the fractional coordinates
+        # do not change: pass them without making copies.
         new_sites = []
         for site in self._sites:
             new_sites.append(PeriodicSite(site.species_and_occu,
-                                          site.frac_coords,
+                                          site._fcoords,
                                           self._lattice,
                                           properties=site.properties))
         self._sites = new_sites
@@ -2475,19 +2484,29 @@ class Structure(IStructure, collections.MutableSequence):
         """
         if not isinstance(indices, collections.Iterable):
             indices = [indices]
-
-        for i in indices:
+        indices = list(indices)
+        if not indices:
+            return
+
+        # Translate all the coordinates at once. A cartesian vector is
+        # converted to fractional coordinates a single time. A site whose
+        # index is repeated is translated once per occurrence.
+        if not frac_coords:
+            vector = self._lattice.get_fractional_coords(vector)
+        counts = np.bincount(np.arange(len(self._sites))[indices])
+        indices = np.flatnonzero(counts)
+        all_fcoords = np.array([self._sites[i].frac_coords
+                                for i in indices]) + \
+            counts[indices, None] * np.asarray(vector)
+        if to_unit_cell:
+            all_fcoords = np.mod(all_fcoords, 1)
+
+        for i, fcoords in zip(indices, all_fcoords):
             site = self._sites[i]
-            if frac_coords:
-                fcoords = site.frac_coords + vector
-            else:
-                fcoords = self._lattice.get_fractional_coords(site.coords
-                                                              + vector)
-            new_site = PeriodicSite(site.species_and_occu, fcoords,
-                                    self._lattice, to_unit_cell=to_unit_cell,
-                                    coords_are_cartesian=False,
-                                    properties=site.properties)
-            self._sites[i] = new_site
+            self._sites[i] = PeriodicSite(site.species_and_occu, fcoords,
+                                          self._lattice,
+                                          coords_are_cartesian=False,
+                                          properties=site.properties)
 
     def perturb(self, distance):
         """
@@ -2852,6 +2871,7 @@ class Molecule(IMolecule, collections.MutableSequence):
         Args:
             indices: Sequence of indices of sites to delete.
         """
+        indices = set(indices)
         self._sites = [self._sites[i] for i in range(len(self._sites))
                        if i not in indices]
 
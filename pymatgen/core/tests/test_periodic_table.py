@@ -276,5 +276,13 @@ class FuncTest(unittest.TestCase):
         self.assertEqual(get_el_sp("X2+"), DummySpecie("X", 2))
         self.assertEqual(get_el_sp("Mn3+"), Specie("Mn", 3))
 
+        # Element/Specie inputs are returned as is, never as an equal
+        # object from an earlier call.
+        for sp in [Specie("Fe", 2), Specie("Fe", 2.0),
+                   Specie("Fe", 2, {"spin": 5}),
+                   DummySpecie("X", 0, {"spin": 1}),
+                   DummySpecie("X", 0, {"spin": 2}), Element.Fe]:
+            self.assertIs(get_el_sp(sp), sp)
+
 if __name__ == "__main__":
     unittest.main()
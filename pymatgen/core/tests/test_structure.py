@@ -595,6 +595,14 @@ class StructureTest(PymatgenTest):
         self.assertArrayAlmostEqual(self.structure.frac_coords[0],
                                     [1.00187517, 1.25665291, 1.15946374])
 
+        # A repeated index translates the site once per occurrence.
+        fcoords = self.structure.frac_coords
+        self.structure.translate_sites([1, 1], [0.125, 0.25, 0],
+                                       frac_coords=True, to_unit_cell=False)
+        self.assertArrayAlmostEqual(self.structure.frac_coords[1],
+                                    fcoords[1] + [0.25, 0.5, 0])
+        self.assertArrayAlmostEqual(self.structure.frac_coords[0], fcoords[0])
+
     def test_mul(self):
         self.structure *= [2, 1, 1]
         self.assertEqual(self.structure.formula, "Si4")
@@ -423,7 +423,9 @@ class YamlTokenizer(collections.Iterator):
     def __init__(self, filename):
         # The position inside the file.
         self.linepos = 0
-        self.stream = open(filename, "r")
+        # Use a large buffer: ABINIT log files can be huge and EventsParser
+        # scans them line by line every time the status of the task is checked.
+        self.stream = open(filename, "r", 64 * 1024)
 
     def __iter__(self):
         return self
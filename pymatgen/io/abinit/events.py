@@ -21,6 +21,7 @@ import numpy as np
 from monty.string import indent, is_string, list_strings
 from monty.fnmatch import WildCard
 from monty.termcolor import colored
+from monty.functools import lazy_property
 from monty.inspect import all_subclasses
 from monty.json import MontyDecoder
 from pymatgen.core import Structure
@@ -276,7 +277,6 @@ class EventReport(collections.Iterable, MSONable):
             events: List of Event objects
         """
         self.filename = os.path.abspath(filename)
-        self.stat = os.stat(self.filename)
         self.start_datetime, self.end_datetime = None, None
 
         self._events = []
@@ -292,6 +292,11 @@ class EventReport(collections.Iterable, MSONable):
     def __iter__(self):
         return self._events.__iter__()
 
+    @lazy_property
+    def stat(self):
+        """Results of os.stat on the file (computed only if needed)."""
+        return os.stat(self.filename)
+
     def __getitem__(self, slice):
         return self._events[slice]
 
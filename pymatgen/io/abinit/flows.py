@@ -950,7 +950,8 @@ class Flow(Node, NodeContainer, MSONable):
                 List of node identifiers. By defaults all nodes are shown
             wslice: Slice object used to select works.
         """
-        lines = []
+        # Write the input of each task as soon as it's available instead of
+        # accumulating the (possibly large) strings of all the tasks in memory.
         for task in self.select_tasks(nids=nids, wslice=wslice):
             s = task.make_input(with_header=True)
 
@@ -960,9 +961,7 @@ class Flow(Node, NodeContainer, MSONable):
             else:
                 s += "\n\nDependencies: None"
 
-            lines.append(2*"\n" + 80 * "=" + "\n" + s + 2*"\n")
-
-        stream.writelines(lines)
+            stream.write(2*"\n" + 80 * "=" + "\n" + s + 2*"\n")
 
     def listext(self, ext, stream=sys.stdout):
         """
@@ -5,8 +5,9 @@
 from __future__ import unicode_literals, division, print_function
 
 import os.path
+import numpy as np
 
-from monty.dev import requires, deprecated
+from monty.dev import deprecated
 from monty.collections import AttrDict
 from monty.functools import lazy_property
 from pymatgen.core.units import ArrayWithUnit
@@ -32,10 +33,21 @@ __all__ = [
     "structure_from_ncdata",
 ]
 
-try:
-    import netCDF4
-except ImportError:
-    netCDF4 = None
+def _import_netcdf4():
+    """
+    Import netCDF4 on demand. netCDF4 (and the HDF5 library it loads) is slow to import
+    and it's needed only when we open a file. Returns the module or None if not installed.
+    """
+    global netCDF4
+    if netCDF4 is None:
+        try:
+            import netCDF4
+        except ImportError:
+            pass
+
+    return netCDF4
+
+netCDF4 = None
 
 
 def _asreader(file, cls):
@@ -75,9 +87,11 @@ class NetcdfReader(object):
     """
     Error = NetcdfReaderError
 
-    @requires(netCDF4 is not None, "netCDF4 must be installed to use this class")
     def __init__(self, path):
         """Open the Netcdf file specified by path (read mode)."""
+        if _import_netcdf4() is None:
+            raise RuntimeError("netCDF4 must be installed to use this class")
+
         self.path = os.path.abspath(path)
 
         try:
@@ -85,8 +99,6 @@ class NetcdfReader(object):
         except Exception as exc:
             raise self.Error("In file %s: %s" % (self.path, str(exc)))
 
-        self.ngroups = len(list(self.walk_tree()))
-
         #self.path2group = collections.OrderedDict()
         #for children in self.walk_tree():
         #   for child in children:
@@ -97,6 +109,14 @@ class NetcdfReader(object):
         """Activated when used in the with statement."""
         return self
 
+    @lazy_property
+    def ngroups(self):
+        """
+        Number of groups in the file. Computed on demand so that opening
+        the file to read a few variables does not require walking the group tree.
+        """
+        return len(list(self.walk_tree()))
+
     def __exit__(self, type, value, traceback):
         """Activated at the end of the with statement. It automatically closes the file."""
         self.rootgrp.close()
@@ -274,18 +294,14 @@ def structure_from_ncdata(ncdata, site_properties=None, cls=Structure):
     lattice = ArrayWithUnit(ncdata.read_value("primitive_vectors"), "bohr").to("ang")
 
     red_coords = ncdata.read_value("reduced_atom_positions")
-    natom = len(red_coords)
 
     znucl_type = ncdata.read_value("atomic_numbers")
 
     # type_atom[0:natom] --> index Between 1 and number of atom species
     type_atom = ncdata.read_value("atom_species")
 
-    # Fortran to C index and float --> int conversion.
-    species = natom * [None]
-    for atom in range(natom):
-        type_idx = type_atom[atom] - 1
-        species[atom] = int(znucl_type[type_idx])
+    # Fortran to C index and float --> int conversion (fancy indexing, no loop over atoms).
+    species = [int(z) for z in znucl_type[np.asarray(type_atom) - 1]]
 
     d = {}
     if site_properties is not None:
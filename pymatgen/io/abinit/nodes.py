@@ -59,7 +59,13 @@ class Status(int):
         (11, "Completed",     "green"  , None, None),         # Execution completed successfully.
     ]
     _STATUS2STR = collections.OrderedDict([(t[0], t[1]) for t in _STATUS_INFO])
+    _STR2STATUS = {t[1]: t[0] for t in _STATUS_INFO}
     _STATUS2COLOR_OPTS = collections.OrderedDict([(t[0], {"color": t[2], "on_color": t[3], "attrs": _2attrs(t[4])}) for t in _STATUS_INFO])
+    # Cache for the colorized strings, filled by the colored property.
+    _STATUS2COLORED = {}
+    # Values of the critical status, used in is_critical.
+    _CRITICAL_STATUS = frozenset(t[0] for t in _STATUS_INFO
+                                 if t[1] in ("AbiCritical", "QCritical", "Unconverged", "Error"))
 
     def __repr__(self):
         return "<%s: %s, at %s>" % (self.__class__.__name__, str(self), id(self))
@@ -77,10 +83,9 @@ class Status(int):
     @classmethod
     def from_string(cls, s):
         """Return a `Status` instance from its string representation."""
-        for num, text in cls._STATUS2STR.items():
-            if text == s:
-                return cls(num)
-        else:
+        try:
+            return cls(cls._STR2STATUS[s])
+        except KeyError:
             raise ValueError("Wrong string %s" % s)
 
     @classmethod
@@ -91,7 +96,7 @@ class Status(int):
     @property
     def is_critical(self):
         """True if status is critical."""
-        return str(self) in ("AbiCritical", "QCritical", "Uncoverged", "Error") 
+        return self in self._CRITICAL_STATUS
 
     @property
     def color_opts(self):
@@ -100,7 +105,13 @@ class Status(int):
     @property
     def colored(self):
         """Return colorized text used to print the status if the stream supports it."""
-        return colored(str(self), **self.color_opts) 
+        # colored honours ANSI_COLORS_DISABLED hence the env variable is part of the key.
+        key = (int(self), os.getenv("ANSI_COLORS_DISABLED") is None)
+        try:
+            return self._STATUS2COLORED[key]
+        except KeyError:
+            s = self._STATUS2COLORED[key] = colored(str(self), **self.color_opts)
+            return s
 
 
 class Dependency(object):
@@ -724,7 +735,7 @@ class Node(six.with_metaclass(abc.ABCMeta, object)):
 
     def depends_on(self, other):
         """True if this node depends on the other node."""
-        return other in [d.node for d in self.deps]
+        return any(d.node == other for d in self.deps)
 
     def get_parents(self):
         """Return the list of nodes in the :class:`Flow` required by this :class:`Node`"""
@@ -2357,11 +2357,12 @@ class DojoReport(dict):
     @classmethod
     def from_hints(cls, ppgen_ecut, symbol):
         """Initialize the DojoReport from an initial value of ecut in Hartree."""
-        dense_right = np.arange(ppgen_ecut, ppgen_ecut + 6*2, step=2)
-        dense_left = np.arange(max(ppgen_ecut-6, 2), ppgen_ecut, step=2)
-        coarse_high = np.arange(ppgen_ecut + 15, ppgen_ecut + 35, step=5)
+        dense_right = np.arange(ppgen_ecut, ppgen_ecut + 6*2, step=2, dtype=np.float64)
+        dense_left = np.arange(max(ppgen_ecut-6, 2), ppgen_ecut, step=2, dtype=np.float64)
+        coarse_high = np.arange(ppgen_ecut + 15, ppgen_ecut + 35, step=5, dtype=np.float64)
 
-        ecut_list = list(dense_left) + list(dense_right) + list(coarse_high)
+        # Use tolist so that we get python floats instead of numpy scalars.
+        ecut_list = dense_left.tolist() + dense_right.tolist() + coarse_high.tolist()
         return cls(ecut_list=ecut_list, symbol=symbol) #, **{k: {}: for k in self.ALL_TRIALS})
 
     def __init__(self, *args, **kwargs):
@@ -46,12 +46,15 @@ def num_valence_electrons(pseudos, structure):
     """
     table = PseudoTable.as_table(pseudos)
 
+    # Search the table once per element, not once per site.
+    zval = {}
     valence = 0.0
     for site in structure:
-        entries = table.pseudos_with_symbol(site.specie.symbol)
-        if len(entries) != 1:
-            raise ValueError("Found %d entries for symbol %s" % (len(entries), site.specie.symbol))
-        valence += entries[0].Z_val
+        symbol = site.specie.symbol
+        if symbol not in zval:
+            zval[symbol] = table.pseudo_with_symbol(symbol).Z_val
+
+        valence += zval[symbol]
 
     return valence
 
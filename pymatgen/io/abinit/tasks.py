@@ -61,6 +61,17 @@ def straceback():
     import traceback
     return traceback.format_exc()
 
+def _file_stamp(afile):
+    """
+    Return a tuple (inode, size, mtime) that changes when the file is modified.
+    None if the file does not exist.
+    """
+    try:
+        st = afile.get_stat()
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime
+
 def nmltostring(nml):
     if not isinstance(nml,dict):
       raise ValueError("nml should be a dict !")
@@ -1136,9 +1147,12 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
                                                                                       
         In this case we just remove the process since Subprocess objects cannot be pickled.
         This is the reason why we have to store the returncode in self._returncode instead
-        of using self.process.returncode.
+        of using self.process.returncode. The cached event reports, the cached
+        final structure and the prefix paths are removed as well
+        (the Prefix namedtuple is deleted from the class body and cannot be pickled).
         """
-        return {k: v for k, v in self.__dict__.items() if k not in ["_process"]}
+        return {k: v for k, v in self.__dict__.items()
+                if k not in ["_process", "_prev_reports", "_final_structure", "_prefix_paths"]}
 
     #@check_spectator
     def set_workdir(self, workdir, chroot=False):
@@ -1148,6 +1162,9 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
 
         self.workdir = os.path.abspath(workdir)
 
+        # The prefix paths depend on workdir: drop the cached value (chroot).
+        self.__dict__.pop("_prefix_paths", None)
+
         # Files required for the execution.
         self.input_file = File(os.path.join(self.workdir, "run.abi"))
         self.output_file = File(os.path.join(self.workdir, "run.abo"))
@@ -1168,6 +1185,14 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
         self.qerr_file = File(os.path.join(self.workdir, "queue.qerr"))
         self.qout_file = File(os.path.join(self.workdir, "queue.qout"))
 
+    @lazy_property
+    def _prefix_paths(self):
+        """
+        Absolute paths of the prefixes for (input|output|temporary) data.
+        self.prefix is a class constant hence the paths are joined once per workdir.
+        """
+        return self.prefix._make(os.path.join(self.workdir, p) for p in self.prefix)
+
     def set_manager(self, manager):
         """Set the :class:`TaskManager` used to launch the Task."""
         self.manager = manager.deepcopy()
@@ -1256,14 +1281,14 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
         Returns the path of the input file with extension ext.
         Use it when the file does not exist yet.
         """
-        return os.path.join(self.workdir, self.prefix.idata + "_" + ext)
+        return self._prefix_paths.idata + "_" + ext
 
     def opath_from_ext(self, ext):
         """
         Returns the path of the output file with extension ext.
         Use it when the file does not exist yet.
         """
-        return os.path.join(self.workdir, self.prefix.odata + "_" + ext)
+        return self._prefix_paths.odata + "_" + ext
 
     @abc.abstractproperty
     def executable(self):
@@ -1291,8 +1316,11 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
     @property
     def can_run(self):
         """The task can run if its status is < S_SUB and all the other dependencies (if any) are done!"""
-        all_ok = all([stat == self.S_OK for stat in self.deps_status])
-        return self.status < self.S_SUB and self.status != self.S_LOCKED and all_ok
+        # Test the status of the task first: the status of the dependencies is more expensive
+        # to compute (works loop over their tasks) and is not needed for tasks already submitted.
+        if self.status >= self.S_SUB or self.status == self.S_LOCKED:
+            return False
+        return all(d.status == self.S_OK for d in self.deps)
 
     #@check_spectator
     def cancel(self):
@@ -1645,27 +1673,37 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
             # The job was not submitted properly
             return self.set_status(self.S_QCRITICAL, msg="return code %s" % self.returncode)
 
+        # The files inspected below are all located in workdir: list the directory once
+        # instead of calling os.path.exists for each file (some of them are tested several times).
+        try:
+            fnames = set(os.listdir(self.workdir))
+        except OSError:
+            # workdir has not been created yet.
+            fnames = set()
+
+        def exists(afile):
+            return afile.basename in fnames
+
         # If we have an abort file produced by Abinit
-        if self.mpiabort_file.exists:
+        if exists(self.mpiabort_file):
             return self.set_status(self.S_ABICRITICAL, msg="Found ABINIT abort file")
 
         # Analyze the stderr file for Fortran runtime errors.
         err_msg = None
-        if self.stderr_file.exists:
+        if exists(self.stderr_file):
             err_msg = self.stderr_file.read()
 
         # Analyze the stderr file of the resource manager runtime errors.
         qerr_info = None
-        if self.qerr_file.exists:
+        if exists(self.qerr_file):
             qerr_info = self.qerr_file.read()
 
         # Analyze the stdout file of the resource manager (needed for PBS !)
-        qout_info = None
-        if self.qout_file.exists:
-            qout_info = self.qout_file.read()
+        # Its content is parsed by the scheduler parser: here we only need to know if it's empty.
+        has_qout = exists(self.qout_file) and self.qout_file.get_stat().st_size > 0
 
         # Start to check ABINIT status if the output file has been created.
-        if self.output_file.exists:
+        if exists(self.output_file):
             try:
                 report = self.get_event_report()
             except Exception as exc:
@@ -1681,7 +1719,9 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
                 self.datetimes.end = report.end_datetime
 
                 # Check if the calculation converged.
-                not_ok = report.filter_types(self.CRITICAL_EVENTS)
+                # Don't use report.filter_types here: we only need to know whether
+                # a critical event is present, not to build a new EventReport.
+                not_ok = any(type(ev) in self.CRITICAL_EVENTS for ev in report)
                 if not_ok:
                     return self.set_status(self.S_UNCONVERGED, msg='status set to unconverged based on abiout')
                 else:
@@ -1704,21 +1744,21 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
                 return self.set_status(self.S_ABICRITICAL, msg=msg)
 
             # 5)
-            if self.stderr_file.exists and not err_msg:
-                if self.qerr_file.exists and not qerr_info:
+            if exists(self.stderr_file) and not err_msg:
+                if exists(self.qerr_file) and not qerr_info:
                     # there is output and no errors
                     # The job still seems to be running
                     return self.set_status(self.S_RUN, msg='there is output and no errors: job still seems to be running')
 
         # 6)
-        if not self.output_file.exists:
+        if not exists(self.output_file):
             logger.debug("output_file does not exists")
-            if not self.stderr_file.exists and not self.qerr_file.exists:     
+            if not exists(self.stderr_file) and not exists(self.qerr_file):
                 # No output at allThe job is still in the queue.
                 return self.status
                 
         # 7) Analyze the files of the resource manager and abinit and execution err (mvs)
-        if qerr_info or qout_info:
+        if qerr_info or has_qout:
             from pymatgen.io.abinit.scheduler_error_parsers import get_parser
             scheduler_parser = get_parser(self.manager.qadapter.QTYPE, err_file=self.qerr_file.path,
                                           out_file=self.qout_file.path, run_err_file=self.stderr_file.path)
@@ -1737,7 +1777,7 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
                 return self.set_status(self.S_QCRITICAL, msg=msg)
                 # The job is killed or crashed and we know what happened
             elif qerr_info:
-                # if only qout_info, we are not necessarily in QCRITICAL state, since there will always be info in the qout file
+                # if only has_qout, we are not necessarily in QCRITICAL state, since there will always be info in the qout file
                 if len(qerr_info) > 0:
                     #logger.history.debug('found unknown queue error: %s' % str(qerr_info))
                     msg = 'found unknown queue error: %s' % str(qerr_info)
@@ -1759,7 +1799,7 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
         # print('the job still seems to be running maybe it is hanging without producing output... ')
 
         # Check time of last modification.
-        if self.output_file.exists and \
+        if exists(self.output_file) and \
            (time.time() - self.output_file.get_stat().st_mtime > self.manager.policy.frozen_timeout):
             msg = "Task seems to be frozen, last change more than %s [s] ago" % self.manager.policy.frozen_timeout
             return self.set_status(self.S_ERROR, msg=msg)
@@ -1904,9 +1944,20 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
                 abort_report = parser.parse(self.mpiabort_file.path)
                 return abort_report
 
+        # Reuse the report computed in the previous call if the files have not been modified.
+        # The main consumers (check_status, show_status, fix_abicritical) call this method
+        # at each iteration of the scheduler and completed tasks are parsed again and again.
+        stamp = (_file_stamp(ofile), _file_stamp(self.mpiabort_file))
+        try:
+            prev_reports = self._prev_reports
+        except AttributeError:
+            prev_reports = self._prev_reports = {}
+
+        if source in prev_reports and prev_reports[source][0] == stamp:
+            return prev_reports[source][1]
+
         try:
             report = parser.parse(ofile.path)
-            #self._prev_reports[source] = report
 
             # Add events found in the ABI_MPIABORTFILE.
             if self.mpiabort_file.exists:
@@ -1927,6 +1978,7 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
                 else:
                     report.append(last_abort_event)
 
+            prev_reports[source] = (stamp, report)
             return report
 
         #except parser.Error as exc:
@@ -2010,9 +2062,8 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
         self.outdir.makedirs()
         self.tmpdir.makedirs()
 
-        # Write files file and input file.
-        if not self.files_file.exists:
-            self.files_file.write(self.filesfile_string)
+        # Write files file (if not already present) and input file.
+        self.files_file.write_if_not_exists(self.filesfile_string)
 
         self.input_file.write(self.make_input())
         self.manager.write_jobfile(self)
@@ -2041,7 +2092,7 @@ class Task(six.with_metaclass(abc.ABCMeta, Node)):
 
     def remove_files(self, *filenames):
         """Remove all the files listed in filenames."""
-        filenames = list_strings(filenames)
+        filenames = set(list_strings(filenames))
 
         for dirpath, dirnames, fnames in os.walk(self.workdir):
             for fname in fnames:
@@ -2280,12 +2331,14 @@ class AbinitTask(Task):
         """List of pseudos used in the calculation."""
         return self.input.pseudos
 
-    @property
+    # The pseudos of the input do not change after the creation of the task
+    # hence isnc and ispaw can be computed only once.
+    @lazy_property
     def isnc(self):
         """True if norm-conserving calculation."""
         return self.input.isnc
 
-    @property
+    @lazy_property
     def ispaw(self):
         """True if PAW calculation"""
         return self.input.ispaw
@@ -2293,15 +2346,13 @@ class AbinitTask(Task):
     @property
     def filesfile_string(self):
         """String with the list of files and prefixes needed to execute ABINIT."""
-        lines = []
-        app = lines.append
-        pj = os.path.join
-
-        app(self.input_file.path)                 # Path to the input file
-        app(self.output_file.path)                # Path to the output file
-        app(pj(self.workdir, self.prefix.idata))  # Prefix for input data
-        app(pj(self.workdir, self.prefix.odata))  # Prefix for output data
-        app(pj(self.workdir, self.prefix.tdata))  # Prefix for temporary data
+        lines = [
+            self.input_file.path,          # Path to the input file
+            self.output_file.path,         # Path to the output file
+            self._prefix_paths.idata,      # Prefix for input data
+            self._prefix_paths.odata,      # Prefix for output data
+            self._prefix_paths.tdata,      # Prefix for temporary data
+        ]
 
         # Paths to the pseudopotential files.
         # Note that here the pseudos **must** be sorted according to znucl.
@@ -2319,8 +2370,7 @@ class AbinitTask(Task):
             else:
                 raise ValueError("Cannot find pseudo with znucl %s in pseudos:\n%s" % (z, self.pseudos))
 
-        for pseudo in ord_pseudos:
-            app(pseudo.path)
+        lines.extend(pseudo.path for pseudo in ord_pseudos)
 
         return "\n".join(lines)
 
@@ -2925,12 +2975,25 @@ class RelaxTask(GsTask, ProduceHist):
 
     def get_final_structure(self):
         """Read the final structure from the GSR file."""
+        # Called by each child with a `@structure` dependency:
+        # read the GSR file again only if it has been modified.
+        stamp = _file_stamp(File(self.gsr_path)) if self.gsr_path else None
+        try:
+            prev_stamp, structure = self._final_structure
+            if stamp is not None and prev_stamp == stamp:
+                return structure.copy()
+        except AttributeError:
+            pass
+
         try:
             with self.open_gsr() as gsr:
-                return gsr.structure
+                structure = gsr.structure
         except AttributeError:
             raise RuntimeError("Cannot find the GSR file with the final structure to restart from.")
 
+        self._final_structure = (stamp, structure)
+        return structure.copy()
+
     def restart(self):
         """
         Restart the structural relaxation.
@@ -3597,7 +3660,7 @@ class OpticTask(Task):
         #optic        ! Root name for all files that will be produced
         app(self.input_file.path)                           # Path to the input file
         app(os.path.join(self.workdir, "unused"))           # Path to the output file
-        app(os.path.join(self.workdir, self.prefix.odata))  # Prefix for output data
+        app(self._prefix_paths.odata)                       # Prefix for output data
 
         return "\n".join(lines)
 
@@ -231,6 +231,119 @@ class FlowTest(FlowUnitTest):
                 assert task.workdir == os.path.join(work.workdir, "t%d" % t)
 
 
+class TaskTest(FlowUnitTest):
+
+    def test_prefix_paths(self):
+        """Testing the prefix paths of the task."""
+        flow = Flow(workdir=self.workdir, manager=self.manager)
+        task = flow.register_task(self.fake_input)[0]
+        flow.allocate()
+
+        assert task.ipath_from_ext("DEN") == os.path.join(task.workdir, "indata", "in_DEN")
+        assert task.opath_from_ext("WFK") == os.path.join(task.workdir, "outdata", "out_WFK")
+
+        # Tasks pickled before the paths were cached don't have the attribute.
+        task.__dict__.pop("_prefix_paths", None)
+        assert task.opath_from_ext("WFK") == os.path.join(task.workdir, "outdata", "out_WFK")
+
+        # chroot must reset the paths.
+        new_workdir = os.path.join(self.workdir, "chroot")
+        task.set_workdir(new_workdir, chroot=True)
+        assert task.opath_from_ext("WFK") == os.path.join(new_workdir, "outdata", "out_WFK")
+
+    def test_prefix_paths_pickle(self):
+        """Testing that the prefix paths don't break pickle."""
+        flow = Flow(workdir=self.workdir, manager=self.manager)
+        task = flow.register_task(self.fake_input)[0]
+        flow.build()
+        opath = task.opath_from_ext("WFK")
+        assert "_prefix_paths" in task.__dict__
+
+        assert flow.pickle_dump() == 0
+        same_task = Flow.pickle_load(self.workdir)[0][0]
+        assert "_prefix_paths" not in same_task.__dict__
+        assert same_task.opath_from_ext("WFK") == opath
+
+    def test_event_report_cache(self):
+        """Testing the cache used by get_event_report."""
+        flow = Flow(workdir=self.workdir, manager=self.manager)
+        task = flow.register_task(self.fake_input)[0]
+        flow.build()
+
+        log_path = task.log_file.path
+        shutil.copy(ref_file("mgb2_scf.log"), log_path)
+        report = task.get_event_report()
+        assert report is not None
+        # Cache hit.
+        assert task.get_event_report() is report
+
+        # Appending to the log file invalidates the cache.
+        with open(log_path, "a") as fh:
+            fh.write("\n")
+        new_report = task.get_event_report()
+        assert new_report is not report
+        assert task.get_event_report() is new_report
+
+        # Replacing the file as well (new inode).
+        tmp_path = log_path + ".tmp"
+        shutil.copy(ref_file("mgb2_scf.log"), tmp_path)
+        os.rename(tmp_path, log_path)
+        assert task.get_event_report() is not new_report
+
+        # The cached reports are not saved in the pickle file.
+        assert hasattr(task, "_prev_reports")
+        flow.pickle_dump()
+        same_task = Flow.pickle_load(self.workdir)[0][0]
+        assert not hasattr(same_task, "_prev_reports")
+
+    def test_final_structure_cache(self):
+        """Testing the cache used by RelaxTask.get_final_structure."""
+        flow = Flow(workdir=self.workdir, manager=self.manager)
+        work = Work()
+        task = work.register_relax_task(self.fake_input)
+        flow.register_work(work)
+        flow.build()
+
+        gsr_path = os.path.join(task.outdir.path, "out_GSR.nc")
+        with open(gsr_path, "wb") as fh:
+            fh.write(b"GSR")
+
+        # Replace the netcdf reader: count how many times the file is read.
+        structure = self.fake_input.structure
+        reads = []
+
+        class FakeGsr(object):
+            def __enter__(self):
+                reads.append(1)
+                return self
+            def __exit__(self, exc_type, exc_value, traceback):
+                pass
+            @property
+            def structure(self):
+                return structure
+
+        task.open_gsr = FakeGsr
+
+        s1 = task.get_final_structure()
+        s2 = task.get_final_structure()
+        assert len(reads) == 1
+        assert s1 == s2 == structure
+        # Callers get their own copy.
+        assert s1 is not s2
+
+        # A modified GSR file is read again.
+        with open(gsr_path, "ab") as fh:
+            fh.write(b"more data")
+        task.get_final_structure()
+        assert len(reads) == 2
+
+        # The cached structure is not saved in the pickle file.
+        del task.open_gsr
+        flow.pickle_dump()
+        same_task = Flow.pickle_load(self.workdir)[0][0]
+        assert not hasattr(same_task, "_final_structure")
+
+
 class TestFlowInSpectatorMode(FlowUnitTest):
 
     def test_spectator(self):
@@ -0,0 +1,26 @@
+# coding: utf-8
+# Copyright (c) Pymatgen Development Team.
+# Distributed under the terms of the MIT License.
+
+from __future__ import unicode_literals, division, print_function
+
+from pymatgen.util.testing import PymatgenTest
+from pymatgen.io.abinit.nodes import Node, Status
+
+
+class StatusTest(PymatgenTest):
+
+    def test_is_critical(self):
+        """Testing Status.is_critical."""
+        for status in (Node.S_ABICRITICAL, Node.S_QCRITICAL, Node.S_UNCONVERGED, Node.S_ERROR):
+            assert status.is_critical
+            assert Status.as_status(str(status)).is_critical
+
+        for status in (Node.S_INIT, Node.S_LOCKED, Node.S_READY, Node.S_SUB,
+                       Node.S_RUN, Node.S_DONE, Node.S_OK):
+            assert not status.is_critical
+
+
+if __name__ == "__main__":
+    import unittest2 as unittest
+    unittest.main()
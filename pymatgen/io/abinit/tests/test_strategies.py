@@ -0,0 +1,51 @@
+# coding: utf-8
+# Copyright (c) Pymatgen Development Team.
+# Distributed under the terms of the MIT License.
+
+from __future__ import unicode_literals, division, print_function
+
+import os.path
+
+from pymatgen.util.testing import PymatgenTest
+from pymatgen.core.lattice import Lattice
+from pymatgen.core.structure import Structure
+from pymatgen.io.abinit.pseudos import PseudoTable
+from pymatgen.io.abinit.strategies import num_valence_electrons
+
+_test_dir = os.path.join(os.path.dirname(__file__), "..", "..", "..", "..",
+                        'test_files', "abinit")
+
+
+def ref_files(*filenames):
+    return [os.path.join(_test_dir, f) for f in filenames]
+
+
+class NumValenceElectronsTest(PymatgenTest):
+
+    def setUp(self):
+        lattice = Lattice([[3.8401979337, 0.00, 0.00],
+                          [1.9200989668, 3.3257101909, 0.00],
+                          [0.00, -2.2171384943, 3.1355090603]])
+        self.si2 = Structure(lattice, ["Si", "Si"], [[0, 0, 0], [0.75, 0.5, 0.75]])
+
+    def test_num_valence_electrons(self):
+        """Testing num_valence_electrons."""
+        table = PseudoTable(ref_files("14si.pspnc"))
+        self.assertAlmostEqual(num_valence_electrons(table, self.si2), 8)
+        # Lists of paths are accepted as well.
+        self.assertAlmostEqual(num_valence_electrons(ref_files("14si.pspnc"), self.si2), 8)
+
+        # More than one pseudo for Si.
+        table = PseudoTable(ref_files("14si.pspnc", "14si.4.hgh"))
+        with self.assertRaises(ValueError):
+            num_valence_electrons(table, self.si2)
+
+        # No pseudo for Si.
+        table = PseudoTable(ref_files("O.GGA_PBE-JTH-paw.xml"))
+        with self.assertRaises(ValueError):
+            num_valence_electrons(table, self.si2)
+
+
+if __name__ == "__main__":
+    import unittest2 as unittest
+    unittest.main()
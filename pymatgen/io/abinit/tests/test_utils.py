@@ -3,9 +3,33 @@
 # Distributed under the terms of the MIT License.
 from __future__ import unicode_literals, division, print_function
 
+import os
+import shutil
+import stat
+import tempfile
+
 from pymatgen.util.testing import PymatgenTest
 from pymatgen.io.abinit.utils import *
 
+class FileTest(PymatgenTest):
+    def test_write_if_not_exists(self):
+        workdir = tempfile.mkdtemp()
+        try:
+            afile = File(os.path.join(workdir, "run.files"))
+            assert not afile.exists
+
+            assert afile.write_if_not_exists("first")
+            assert afile.exists and afile.read() == "first\n"
+            # No execute bits.
+            assert not os.stat(afile.path).st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+            # The file is not overwritten.
+            assert not afile.write_if_not_exists("second")
+            assert afile.read() == "first\n"
+        finally:
+            shutil.rmtree(workdir)
+
+
 class RpnTest(PymatgenTest):
 
     def test_mongodb_like_conditions(self):
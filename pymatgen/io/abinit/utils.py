@@ -5,6 +5,7 @@
 from __future__ import unicode_literals, division, print_function
 
 import os
+import errno
 import six
 import re
 import collections
@@ -15,9 +16,16 @@ import numpy as np
 from fnmatch import fnmatch
 from six.moves import filter
 from monty.collections import dict2namedtuple
+from monty.functools import lazy_property
 from monty.string import list_strings
 from monty.fnmatch import WildCard
 
+try:
+    from os import scandir
+except ImportError:
+    # Python < 3.5
+    scandir = None
+
 import logging
 logger = logging.getLogger(__name__)
 
@@ -64,7 +72,7 @@ class File(object):
         """Absolute path of the file."""
         return self._path
 
-    @property
+    @lazy_property
     def basename(self):
         """File basename."""
         return os.path.basename(self.path)
@@ -78,7 +86,7 @@ class File(object):
             # current working directory may not be defined!
             return self.path
 
-    @property
+    @lazy_property
     def dirname(self):
         """Absolute path of the directory where the file is located."""
         return os.path.dirname(self.path)
@@ -116,6 +124,27 @@ class File(object):
             else:
                 return f.write(string)
 
+    def write_if_not_exists(self, string):
+        """
+        Write string to file only if the file does not exist yet.
+        The existence check and the creation of the file are performed
+        with a single (atomic) open call. The directory must exist.
+
+        Returns:
+            True if the file has been created.
+        """
+        try:
+            # Same permissions as open(path, "w").
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except OSError as exc:
+            if exc.errno == errno.EEXIST: return False
+            raise
+
+        with os.fdopen(fd, "w") as f:
+            f.write(string if string.endswith("\n") else string + "\n")
+
+        return True
+
     def writelines(self, lines):
         """Write a list of strings to file."""
         self.make_dir()
@@ -176,7 +205,7 @@ class Directory(object):
         """Relative path."""
         return os.path.relpath(self.path)
 
-    @property
+    @lazy_property
     def basename(self):
         """Directory basename."""
         return os.path.basename(self.path)
@@ -229,8 +258,17 @@ class Directory(object):
                   wildcard="*.nc|*.pdf" selects only those files that end with .nc or .pdf
         """
         # Select the files in the directory.
-        fnames = [f for f in os.listdir(self.path)]
-        filepaths = filter(os.path.isfile, [os.path.join(self.path, f) for f in fnames])
+        # scandir returns the absolute paths and the file type without an extra stat per entry.
+        if scandir is not None:
+            it = scandir(self.path)
+            try:
+                filepaths = [entry.path for entry in it if entry.is_file()]
+            finally:
+                # The iterator supports close (and the with statement) only in py>=3.6
+                if hasattr(it, "close"): it.close()
+        else:
+            fnames = [f for f in os.listdir(self.path)]
+            filepaths = list(filter(os.path.isfile, [os.path.join(self.path, f) for f in fnames]))
 
         # Filter using the shell patterns.
         if wildcard is not None:
@@ -252,14 +290,12 @@ class Directory(object):
 
         ext = ext if ext.startswith('_') else '_'+ext
 
-        files = []
-        for f in self.list_filepaths():
-            if f.endswith(ext) or f.endswith(ext + ".nc"):
-                files.append(f)
+        filepaths = self.list_filepaths()
+        files = [f for f in filepaths if f.endswith(ext) or f.endswith(ext + ".nc")]
 
         # This should fix the problem with the 1WF files in which the file extension convention is broken
         if not files:
-            files = [f for f in self.list_filepaths() if fnmatch(f, "*%s*" % ext)]
+            files = [f for f in filepaths if fnmatch(f, "*%s*" % ext)]
 
         if not files:
             return ""
@@ -593,7 +593,10 @@ class Work(BaseWork, NodeContainer):
 
     def check_status(self):
         """Check the status of the tasks."""
-        # Recompute the status of the tasks
+        # Recompute the status of the tasks.
+        # Note that the tasks must be checked sequentially: check_status is not thread-safe
+        # because set_status broadcasts signals whose receivers (e.g. on_ok, on_all_ok)
+        # can modify the work and the flow and write files.
         for task in self:
             if task.status == task.S_LOCKED: continue
             task.check_status()
@@ -692,16 +695,14 @@ class Work(BaseWork, NodeContainer):
         if not self.all_done:
             raise self.Error("Some task is still in running/submitted state")
 
-        etotals = []
-        for task in self:
+        # Preallocate the array and fill it in place.
+        etotals = np.full(len(self), np.inf)
+        for i, task in enumerate(self):
             # Open the GSR file and read etotal (Hartree)
             gsr_path = task.outdir.has_abiext("GSR")
-            etot = np.inf
             if gsr_path:
                 with ETSF_Reader(gsr_path) as r:
-                    etot = r.read_value("etotal")
-                
-            etotals.append(etot)
+                    etotals[i] = r.read_value("etotal")
 
         return EnergyArray(etotals, "Ha").to(unit)
 
@@ -5,6 +5,7 @@
 from __future__ import unicode_literals, division, print_function
 
 import os
+import shutil
 
 from monty.string import list_strings
 from six.moves import map, cStringIO
@@ -133,10 +134,10 @@ class Mrgscr(ExecWrapper):
 
         inp.write("1\n")                 # Option for merging q-points.
 
-        self.stdin_data = [s for s in inp.getvalue()]
+        self.stdin_data = inp.getvalue()
 
         with open(self.stdin_fname, "w") as fh:
-            fh.writelines(self.stdin_data)
+            fh.write(self.stdin_data)
 
         self.execute(workdir)
 
@@ -190,10 +191,10 @@ class Mrggkk(ExecWrapper):
         for fname in gkk_files:
             inp.write(fname + "\n")
 
-        self.stdin_data = [s for s in inp.getvalue()]
+        self.stdin_data = inp.getvalue()
 
         with open(self.stdin_fname, "w") as fh:
-            fh.writelines(self.stdin_data)
+            fh.write(self.stdin_data)
 
         self.execute(workdir)
 
@@ -217,9 +218,7 @@ class Mrgddb(ExecWrapper):
 
         # Handle the case of a single file since mrgddb uses 1 to denote GS files!
         if len(ddb_files) == 1:
-            with open(ddb_files[0], "r") as inh, open(out_ddb, "w") as out:
-                for line in inh:
-                    out.write(line)
+            shutil.copyfile(ddb_files[0], out_ddb)
             return out_ddb
 
         self.stdin_fname, self.stdout_fname, self.stderr_fname = \
@@ -234,10 +233,10 @@ class Mrgddb(ExecWrapper):
         for fname in ddb_files:
             inp.write(fname + "\n")
 
-        self.stdin_data = [s for s in inp.getvalue()]
+        self.stdin_data = inp.getvalue()
 
         with open(self.stdin_fname, "wt") as fh:
-            fh.writelines(self.stdin_data)
+            fh.write(self.stdin_data)
 
         retcode = self.execute(workdir, exec_args=['--nostrict'])
         if retcode == 0 and delete_source_ddbs:
@@ -26,6 +26,8 @@ import itertools
 import logging
 import time
 
+import numpy as np
+
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from pymatgen.core.structure import Structure
 from pymatgen.transformations.transformation_abc import AbstractTransformation
@@ -182,7 +184,7 @@ class TranslateSitesTransformation(AbstractTransformation):
     def __init__(self, indices_to_move, translation_vector,
                  vector_in_frac_coords=True):
         self._indices = indices_to_move
-        self._vector = translation_vector
+        self._vector = np.array(translation_vector, dtype=np.float64)
         self._frac = vector_in_frac_coords
 
     def apply_transformation(self, structure):
@@ -193,7 +195,7 @@ class TranslateSitesTransformation(AbstractTransformation):
     def __str__(self):
         return "TranslateSitesTransformation for indices " + \
             "{}, vect {} and vect_in_frac_coords = {}".format(
-                self._indices, self._vector, self._frac)
+                self._indices, self._vector.tolist(), self._frac)
 
     def __repr__(self):
         return self.__str__()
@@ -201,7 +203,7 @@ class TranslateSitesTransformation(AbstractTransformation):
     @property
     def inverse(self):
         return TranslateSitesTransformation(
-            self._indices, [-c for c in self._vector], self._frac)
+            self._indices, -self._vector, self._frac)
 
     @property
     def is_one_to_many(self):
@@ -210,7 +212,7 @@ class TranslateSitesTransformation(AbstractTransformation):
     def as_dict(self):
         return {"name": self.__class__.__name__, "version": __version__,
                 "init_args": {"indices_to_move": self._indices,
-                              "translation_vector": self._vector,
+                              "translation_vector": self._vector.tolist(),
                               "vector_in_frac_coords": self._frac},
                 "@module": self.__class__.__module__,
                 "@class": self.__class__.__name__}
@@ -337,6 +339,8 @@ class PartialRemoveSitesTransformation(AbstractTransformation):
         allcombis = []
         for ind, num in num_remove_dict.items():
             allcombis.append(itertools.combinations(ind, num))
+        # Every candidate has the same number of sites left.
+        num_sites = len(structure) - sum(num_remove_dict.values())
 
         count = 0
         for allindices in itertools.product(*allcombis):
@@ -345,19 +349,23 @@ class PartialRemoveSitesTransformation(AbstractTransformation):
             for indices in allindices:
                 sites_to_remove.extend([structure[i] for i in indices])
                 indices_list.extend(indices)
-            s_new = structure.copy()
-            s_new.remove_sites(indices_list)
             energy = ewaldsum.compute_partial_energy(indices_list)
             already_tested = False
             for i, tsites in enumerate(tested_sites):
                 tenergy = all_structures[i]["energy"]
-                if abs((energy - tenergy) / len(s_new)) < 1e-5 and \
+                # The energy test is cheap and filters out most candidates
+                # before the symmetry test. One match is enough.
+                if abs((energy - tenergy) / num_sites) < 1e-5 and \
                         sg.are_symmetrically_equivalent(sites_to_remove,
                                                         tsites,
                                                         symm_prec=symprec):
                     already_tested = True
+                    break
 
             if not already_tested:
+                # Only build the structures that are kept.
+                s_new = structure.copy()
+                s_new.remove_sites(indices_list)
                 tested_sites.append(sites_to_remove)
                 all_structures.append({"structure": s_new, "energy": energy})
 
@@ -21,6 +21,7 @@ __date__ = "Sep 23, 2011"
 
 
 import logging
+from collections import defaultdict
 
 from pymatgen.analysis.bond_valence import BVAnalyzer
 from pymatgen.analysis.ewald import EwaldSummation, EwaldMinimizer
@@ -352,8 +353,8 @@ class RemoveSpeciesTransformation(AbstractTransformation):
 
     def apply_transformation(self, structure):
         s = structure.copy()
-        for sp in self._species:
-            s.remove_species([get_el_sp(sp)])
+        # a single pass over the sites removes all the species
+        s.remove_species([get_el_sp(sp) for sp in self._species])
         return s
 
     def __str__(self):
@@ -433,9 +434,9 @@ class PartialRemoveSpecieTransformation(AbstractTransformation):
             transmuted structure class.
         """
         sp = get_el_sp(self._specie)
-        specie_indices = [i for i in range(len(structure))
-                          if structure[i].species_and_occu ==
-                          Composition({sp: 1})]
+        comp = Composition({sp: 1})
+        specie_indices = [i for i, site in enumerate(structure)
+                          if site.species_and_occu == comp]
         trans = PartialRemoveSitesTransformation([specie_indices],
                                                  [self._frac], algo=self._algo)
         return trans.apply_transformation(structure, return_ranked_list)
@@ -550,17 +551,27 @@ class OrderDisorderedStructureTransformation(AbstractTransformation):
         #generate list of equivalent sites to order
         #equivalency is determined by sp_and_occu and symmetry
         #if symmetrized structure is true
+        #(compare the symmetry labels of the sites instead of scanning the
+        #list of equivalent sites of the exemplar)
+        site_labels = structure.site_labels if self._symmetrized else None
+        #exemplars are bucketed by species set, since almost_equals can only
+        #match occupancies with the same species
+        exemplar_buckets = {}
         for i, site in enumerate(structure):
             if site.is_ordered:
                 continue
+            occu = site.species_and_occu
+            bucket = exemplar_buckets.setdefault(
+                frozenset(sp for sp, amt in occu.items()
+                          if abs(amt) > Composition.amount_tolerance), [])
             found = False
-            for j, ex in enumerate(exemplars):
-                sp = ex.species_and_occu
-                if not site.species_and_occu.almost_equals(sp):
+            for j in bucket:
+                ex = exemplars[j]
+                if not occu.almost_equals(ex.species_and_occu):
                     continue
                 if self._symmetrized:
-                    sym_equiv = structure.find_equivalent_sites(ex)
-                    sym_test = site in sym_equiv
+                    sym_test = \
+                        site_labels[i] == site_labels[equivalent_sites[j][0]]
                 else:
                     sym_test = True
                 if sym_test:
@@ -568,6 +579,7 @@ class OrderDisorderedStructureTransformation(AbstractTransformation):
                     found = True
                     break
             if not found:
+                bucket.append(len(exemplars))
                 equivalent_sites.append([i])
                 exemplars.append(site)
 
@@ -575,20 +587,27 @@ class OrderDisorderedStructureTransformation(AbstractTransformation):
         s = Structure.from_sites(structure)
         m_list = []
         for g in equivalent_sites:
-            total_occupancy = sum([structure[i].species_and_occu for i in g],
-                                  Composition())
-            total_occupancy = dict(total_occupancy.items())
+            #accumulate the occupancies and build a single Composition
+            #instead of one intermediate Composition per site
+            total_occupancy = defaultdict(float)
+            for i in g:
+                for sp, amt in structure[i].species_and_occu.items():
+                    total_occupancy[sp] += amt
+            total_occupancy = dict(Composition(total_occupancy).items())
             #round total occupancy to possible values
             for k, v in total_occupancy.items():
                 if abs(v - round(v)) > 0.25:
                     raise ValueError("Occupancy fractions not consistent "
                                      "with size of unit cell")
                 total_occupancy[k] = int(round(v))
-            #start with an ordered structure
-            initial_sp = max(total_occupancy.keys(),
+            #start with an ordered structure. Sorting first makes ties in
+            #|oxi_state| independent of the dict iteration order
+            initial_sp = max(sorted(total_occupancy),
                              key=lambda x: abs(x.oxi_state))
+            #Compositions are immutable: sites can share the same one
+            initial_comp = Composition({initial_sp: 1})
             for i in g:
-                s[i] = initial_sp
+                s[i] = initial_comp
             #determine the manipulations
             for k, v in total_occupancy.items():
                 if k == initial_sp:
@@ -609,6 +628,8 @@ class OrderDisorderedStructureTransformation(AbstractTransformation):
         lowest_energy = ewald_m.output_lists[0][0]
         num_atoms = sum(structure.composition.values())
 
+        # one Composition per species, shared by all the substituted sites
+        sp_comps = {}
         for output in ewald_m.output_lists:
             s_copy = s.copy()
             # do deletions afterwards because they screw up the indices of the
@@ -618,7 +639,10 @@ class OrderDisorderedStructureTransformation(AbstractTransformation):
                 if manipulation[1] is None:
                     del_indices.append(manipulation[0])
                 else:
-                    s_copy[manipulation[0]] = manipulation[1]
+                    sp = manipulation[1]
+                    if sp not in sp_comps:
+                        sp_comps[sp] = Composition({sp: 1})
+                    s_copy[manipulation[0]] = sp_comps[sp]
             s_copy.remove_sites(del_indices)
             self._all_structures.append(
                 {"energy": output[0],
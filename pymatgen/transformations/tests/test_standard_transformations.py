@@ -294,6 +294,25 @@ class OrderDisorderedStructureTransformationTest(unittest.TestCase):
         allstructs = t.apply_transformation(struct, 50)
         self.assertEqual(len(allstructs), 3)
 
+    def test_tied_oxidation_states(self):
+        # Fe2+ and Ni2+ have the same |oxi_state|: the species used for the
+        # initial ordered structure must not depend on the dict order.
+        t = OrderDisorderedStructureTransformation()
+        coords = [[0, 0, 0], [0.75, 0.75, 0.75], [0.5, 0.5, 0.5],
+                  [0.25, 0.25, 0.25]]
+        lattice = Lattice([[3.8401979337, 0.00, 0.00],
+                           [1.9200989668, 3.3257101909, 0.00],
+                           [0.00, -2.2171384943, 3.1355090603]])
+        outputs = []
+        for occu in ({"Fe2+": 0.5, "Ni2+": 0.5}, {"Ni2+": 0.5, "Fe2+": 0.5}):
+            struct = Structure(lattice, [occu, occu, "O2-", "O2-"], coords)
+            outputs.append(t.apply_transformation(struct,
+                                                  return_ranked_list=10))
+        self.assertEqual(len(outputs[0]), len(outputs[1]))
+        for d1, d2 in zip(*outputs):
+            self.assertEqual(d1["structure"], d2["structure"])
+            self.assertAlmostEqual(d1["energy"], d2["energy"])
+
     def test_symmetrized_structure(self):
         t = OrderDisorderedStructureTransformation(symmetrized_structures=True)
         c = []